@@ -13,6 +13,8 @@ from aumai_modality.core import (
     ModalityConverter,
     ModalityHandler,
     ModalityRouter,
+    default_converter,
+    default_router,
 )
 from aumai_modality.models import ConversionResult, ModalInput, ModalOutput, Modality
 
@@ -190,8 +192,8 @@ def demo_agnostic_pipeline() -> None:
     print("Demo 5: Modality-agnostic normalization pipeline")
     print("=" * 60)
 
-    router = ModalityRouter()
-    converter = ModalityConverter()
+    router = default_router()
+    converter = default_converter()
 
     def normalize_to_text(raw: bytes | str) -> str:
         """Detect, route, and convert any input to plain text."""
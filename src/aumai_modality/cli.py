@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import os
 import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import click
 
-from .core import ModalityConverter, ModalityRouter
+from .core import default_converter, default_router
 from .models import ModalInput, Modality
 
+# Built once at import: the choices feed both modality options, and click
+# has already validated values against them, so the command body maps them
+# to members with a plain dict lookup.
+_MODALITY_BY_VALUE: Mapping[str, Modality] = MappingProxyType(
+    {modality.value: modality for modality in Modality}
+)
+_MODALITY_CHOICES = click.Choice(list(_MODALITY_BY_VALUE))
+
 
 @click.group()
 @click.version_option()
@@ -29,14 +40,14 @@ def main() -> None:
     "--target",
     "target_modality",
     required=True,
-    type=click.Choice([m.value for m in Modality]),
+    type=_MODALITY_CHOICES,
     help="Target modality.",
 )
 @click.option(
     "--source-modality",
     "source_modality",
     default=None,
-    type=click.Choice([m.value for m in Modality]),
+    type=_MODALITY_CHOICES,
     help="Source modality (auto-detected if omitted).",
 )
 @click.option(
@@ -53,13 +64,12 @@ def convert_command(
     output_path: str | None,
 ) -> None:
     """Convert a file from one modality to another."""
-    raw_bytes = Path(input_path).read_bytes()
+    raw_bytes = _read_input(input_path)
 
-    router = ModalityRouter()
     if source_modality:
-        detected = Modality(source_modality)
+        detected = _MODALITY_BY_VALUE[source_modality]
     else:
-        detected = router.detect(raw_bytes)
+        detected = default_router().detect(raw_bytes)
         click.echo(f"Detected source modality: {detected.value}", err=True)
 
     modal_input = ModalInput(
@@ -68,26 +78,26 @@ def convert_command(
         mime_type=_guess_mime(input_path, detected),
     )
 
-    converter = ModalityConverter()
-    target = Modality(target_modality)
+    target = _MODALITY_BY_VALUE[target_modality]
 
     try:
-        result = converter.convert(modal_input, target)
+        result = default_converter().convert(modal_input, target)
     except ValueError as exc:
         click.echo(f"Error: {exc}", err=True)
         sys.exit(1)
 
-    output_content = (
-        result.output.content
-        if isinstance(result.output.content, str)
-        else result.output.content.decode("utf-8", errors="replace")
-    )
+    output_content = result.output.content
 
     if output_path:
-        Path(output_path).write_text(output_content, encoding="utf-8")
+        # Bytes output is written as-is; text is encoded exactly once.
+        if isinstance(output_content, str):
+            output_content = output_content.encode("utf-8")
+        _write_output(output_path, output_content)
         click.echo(f"Converted output written to {output_path}")
-    else:
+    elif isinstance(output_content, str):
         click.echo(output_content)
+    else:
+        click.echo(output_content.decode("utf-8", errors="replace"))
 
     click.echo(
         f"\nConversion: {result.source_modality.value} -> {result.target_modality.value}  "
@@ -106,16 +116,33 @@ def convert_command(
 )
 def detect_command(input_path: str) -> None:
     """Detect the modality of a file."""
-    raw_bytes = Path(input_path).read_bytes()
-    router = ModalityRouter()
-    detected = router.detect(raw_bytes)
+    raw_bytes = _read_input(input_path)
+    detected = default_router().detect(raw_bytes)
     click.echo(f"Detected modality: {detected.value}")
 
 
-def _guess_mime(path: str, modality: Modality) -> str:
-    """Guess MIME type from file extension and modality."""
-    ext = Path(path).suffix.lower()
-    mime_map: dict[str, str] = {
+def _read_input(path: str) -> bytes:
+    """Read the raw bytes of an input file."""
+    return Path(path).read_bytes()
+
+
+# O_BINARY only exists on Windows, where it stops newline translation.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_output(path: str, data: bytes) -> None:
+    """Write *data* to *path*, creating or truncating it, without buffering."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+_MIME_MAP: Mapping[str, str] = MappingProxyType(
+    {
         ".json": "application/json",
         ".txt": "text/plain",
         ".md": "text/markdown",
@@ -126,7 +153,12 @@ def _guess_mime(path: str, modality: Modality) -> str:
         ".wav": "audio/wav",
         ".mp4": "video/mp4",
     }
-    return mime_map.get(ext, "application/octet-stream")
+)
+
+
+def _guess_mime(path: str, modality: Modality) -> str:
+    """Guess MIME type from file extension and modality."""
+    return _MIME_MAP.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
 
 
 if __name__ == "__main__":
@@ -2,48 +2,285 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import json
-from abc import ABC, abstractmethod
-from typing import Any
+import re
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, Protocol, runtime_checkable
 
 from .models import ConversionResult, ModalInput, ModalOutput, Modality
 
+# Optional accelerators, see the ``fast`` extra.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    simdjson = None  # type: ignore[assignment, unused-ignore]
+
+# Optional streaming parser, see the ``stream`` extra.
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ijson = None
+
 __all__ = [
     "ModalityHandler",
     "TextHandler",
     "StructuredHandler",
     "ModalityConverter",
     "ModalityRouter",
+    "default_converter",
+    "default_router",
+    "clear_caches",
 ]
 
 
+# ---------------------------------------------------------------------------
+# JSON backend
+# ---------------------------------------------------------------------------
+
+# Stdlib fallback.  The encoder is built once: ``json.dumps`` with
+# non-default arguments constructs a new JSONEncoder on every call.
+_STDLIB_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_STDLIB_DECODER = json.JSONDecoder()
+
+
+# simdjson parsers keep their internal buffers between documents but are not
+# thread-safe, so each thread reuses its own.
+_simdjson_local = threading.local()
+
+
+def _simdjson_parser() -> simdjson.Parser:
+    """Return this thread's reusable simdjson parser."""
+    try:
+        parser: simdjson.Parser = _simdjson_local.parser
+    except AttributeError:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+
+def _orjson_dumps(obj: object) -> str:
+    """Serialize *obj* as 2-space indented JSON, keeping non-ASCII text as-is."""
+    # Built-in handlers promise ``str`` content, so the UTF-8 bytes orjson
+    # produces are decoded here rather than handed to callers.
+    data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return data.decode("utf-8")
+
+
+# What the JSON backends raise for malformed input: json and orjson decode
+# errors, simdjson's parse errors other than the RuntimeErrors below, and
+# strict UTF-8 decode failures all derive from ValueError.  Shared so every
+# parse site catches the same set.
+_JSON_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+
+# simdjson also raises RuntimeError, for BIGINT_ERROR (integers beyond 64
+# bits) and DEPTH_ERROR (deep nesting), both on valid JSON.
+_SIMDJSON_ERRORS: tuple[type[Exception], ...] = (*_JSON_ERRORS, RuntimeError)
+
+# The stdlib ``json`` module is the reference for what counts as JSON and
+# how it round-trips; orjson and simdjson are only used where they agree
+# with it.  They reject NaN/Infinity, out-of-range numbers and lone
+# surrogates, which the stdlib accepts, so their rejections are re-checked
+# with the stdlib.  orjson 3.8 also silently parses integers outside the
+# int64/uint64 range as floats, which can take as few as 19 digits
+# (-9223372036854775809), so documents with an integer of 19+ digits skip
+# it entirely.  Fractions and exponents are excluded so ordinary floats keep
+# the fast path; a match inside a string only costs the slower path.
+_LONG_DIGIT_RUN = re.compile(r"(?<![0-9.])[0-9]{19,}(?![0-9.eE])")
+
+
+def _json_dumps(obj: object) -> str:
+    """Serialize *obj* as 2-space indented JSON, keeping non-ASCII text as-is."""
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj)
+        except orjson.JSONEncodeError:
+            # Lone surrogates and integers above 64 bits.
+            pass
+    return _STDLIB_ENCODER.encode(obj)
+
+
+def _reindent_json(raw: str) -> str:
+    """
+    Parse the JSON document *raw* and return it 2-space indented.
+
+    Raises ``ValueError`` if *raw* is not valid JSON.
+    """
+    if orjson is not None and _LONG_DIGIT_RUN.search(raw) is None:
+        try:
+            return _orjson_dumps(orjson.loads(raw))
+        except (orjson.JSONDecodeError, orjson.JSONEncodeError):
+            pass
+    return _STDLIB_ENCODER.encode(_STDLIB_DECODER.decode(raw))
+
+
+def _is_valid_json_stdlib(data: bytes | str) -> bool:
+    """Return True if the stdlib decoder accepts *data* as one document."""
+    try:
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        # raw_decode skips json.loads' wrapper; check for trailing data.
+        stripped = text.strip(" \t\n\r")
+        _, end = _STDLIB_DECODER.raw_decode(stripped)
+    except _JSON_ERRORS:
+        return False
+    return end == len(stripped)
+
+
+def _is_valid_json(data: bytes | str) -> bool:
+    """
+    Return True if *data* is a complete JSON document.
+
+    Bytes are validated as UTF-8 JSON without being decoded first.  With
+    simdjson available the document is only validated; no Python objects
+    are built for its contents.  Documents the accelerators reject get a
+    second opinion from the stdlib decoder.
+    """
+    if simdjson is not None:
+        try:
+            # The returned proxy is dropped at once, which the parser
+            # requires before it can be reused.
+            _simdjson_parser().parse(data, recursive=False)
+            return True
+        except _SIMDJSON_ERRORS:
+            pass
+    elif orjson is not None:
+        try:
+            orjson.loads(data)
+            return True
+        except _JSON_ERRORS:
+            pass
+    return _is_valid_json_stdlib(data)
+
+
+def _normalize_json(raw: str) -> str:
+    """Return *raw* as indented JSON, wrapping non-JSON text in an envelope."""
+    try:
+        return _reindent_json(raw)
+    except _JSON_ERRORS:
+        return _json_dumps({"text": raw})
+
+
+# Structured inputs above this size are re-indented from a parse event
+# stream when ijson is installed and the stdlib is the active backend,
+# instead of building the whole document.  With orjson active the full
+# parse is used, so number formatting never depends on the input size.
+_STREAM_MIN_SIZE = 64 * 1024
+
+# ijson's yajl backend replaces lone surrogate escapes with "?" and cannot
+# decode a lone low surrogate; documents with any surrogate escape are left
+# to the full parse.
+_SURROGATE_ESCAPE = re.compile(rb"\\u[dD][89a-fA-F]")
+
+_SCALAR_ENCODERS: dict[str, Callable[[Any], str]] = {
+    "string": json.encoder.encode_basestring,
+    "number": repr,
+    "boolean": lambda value: "true" if value else "false",
+    "null": lambda value: "null",
+}
+
+
+def _stream_reindent(data: bytes) -> str | None:
+    """
+    Return the UTF-8 JSON document *data* as 2-space indented JSON.
+
+    The output matches the stdlib encoder's but is written from ijson
+    parse events, so no Python objects are built for the document; peak
+    memory stays near the size of the input and output.  Returns None for
+    invalid JSON and for documents the stream parser cannot reproduce
+    exactly (surrogate escapes, numbers outside 64-bit or float range);
+    the caller then parses the document in full.
+    """
+    if _SURROGATE_ESCAPE.search(data) is not None:
+        return None
+    try:
+        return _stream_events_to_json(ijson.basic_parse(data, use_float=True))
+    except (ijson.JSONError, ValueError):
+        return None
+
+
+def _stream_events_to_json(events: Iterable[tuple[str, Any]]) -> str:
+    """Write ijson basic_parse *events* out as 2-space indented JSON."""
+    out = io.StringIO()
+    write = out.write
+    depth = 0
+    # True until the innermost open container gets its first member.
+    empty = True
+    after_key = False
+    for event, value in events:
+        if event == "end_map" or event == "end_array":
+            depth -= 1
+            if not empty:
+                write("\n" + "  " * depth)
+            write("}" if event == "end_map" else "]")
+            # The enclosing container now holds at least this value.
+            empty = False
+            continue
+        if after_key:
+            after_key = False
+        elif depth:
+            write("\n" + "  " * depth if empty else ",\n" + "  " * depth)
+            empty = False
+        if event == "map_key":
+            write(json.encoder.encode_basestring(value))
+            write(": ")
+            after_key = True
+        elif event == "start_map" or event == "start_array":
+            write("{" if event == "start_map" else "[")
+            depth += 1
+            empty = True
+        else:
+            write(_SCALAR_ENCODERS[event](value))
+    return out.getvalue()
+
+
+# Small payloads (heartbeats, schema probes) recur in event streams, so their
+# detection and normalization results are memoized.  Larger payloads bypass
+# the caches, which bounds their memory at roughly size * max payload.
+_CACHE_SIZE = 1024
+_CACHE_MAX_PAYLOAD = 4096
+
+_normalize_json_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_normalize_json)
+
+
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
 
 
-class ModalityHandler(ABC):
-    """Base class for modality-specific processing."""
+@runtime_checkable
+class ModalityHandler(Protocol):
+    """
+    Interface for modality-specific processing.
+
+    Handlers satisfy it structurally; subclassing is optional.
+    """
 
     @property
-    @abstractmethod
     def modality(self) -> Modality:
         """The modality this handler processes."""
+        ...
 
-    @abstractmethod
     def handle(self, input_data: ModalInput) -> ModalOutput:
         """Process input and return normalized output."""
+        ...
 
-    @abstractmethod
     def to_text(self, input_data: ModalInput) -> str:
         """Extract a plain-text representation of the input."""
+        ...
 
-    @abstractmethod
     def from_text(self, text: str) -> ModalOutput:
         """Produce output in this handler's modality from plain text."""
+        ...
 
 
-class TextHandler(ModalityHandler):
+class TextHandler:
     """Handler for plain-text modality."""
 
     @property
@@ -51,24 +288,14 @@ class TextHandler(ModalityHandler):
         return Modality.text
 
     def handle(self, input_data: ModalInput) -> ModalOutput:
-        content = (
-            input_data.content.decode("utf-8")
-            if isinstance(input_data.content, bytes)
-            else input_data.content
-        )
         return ModalOutput(
             modality=Modality.text,
-            content=content,
+            content=input_data.as_str(),
             mime_type="text/plain",
         )
 
     def to_text(self, input_data: ModalInput) -> str:
-        content = (
-            input_data.content.decode("utf-8")
-            if isinstance(input_data.content, bytes)
-            else input_data.content
-        )
-        return str(content)
+        return input_data.as_str()
 
     def from_text(self, text: str) -> ModalOutput:
         return ModalOutput(
@@ -78,7 +305,7 @@ class TextHandler(ModalityHandler):
         )
 
 
-class StructuredHandler(ModalityHandler):
+class StructuredHandler:
     """
     Handler for structured JSON data.
 
@@ -93,17 +320,12 @@ class StructuredHandler(ModalityHandler):
         return Modality.structured
 
     def handle(self, input_data: ModalInput) -> ModalOutput:
-        raw = (
-            input_data.content.decode("utf-8")
-            if isinstance(input_data.content, bytes)
-            else input_data.content
-        )
+        raw = input_data.as_str()
         # Normalize: ensure the content is valid JSON
-        try:
-            parsed: Any = json.loads(str(raw))
-            serialized = json.dumps(parsed, ensure_ascii=False, indent=2)
-        except (json.JSONDecodeError, TypeError):
-            serialized = json.dumps({"text": str(raw)}, ensure_ascii=False, indent=2)
+        if len(raw) <= _CACHE_MAX_PAYLOAD:
+            serialized = _normalize_json_cached(raw)
+        else:
+            serialized = _normalize_json(raw)
         return ModalOutput(
             modality=Modality.structured,
             content=serialized,
@@ -112,26 +334,30 @@ class StructuredHandler(ModalityHandler):
 
     def to_text(self, input_data: ModalInput) -> str:
         """Serialize structured content to a JSON string."""
-        raw = (
-            input_data.content.decode("utf-8")
-            if isinstance(input_data.content, bytes)
-            else str(input_data.content)
-        )
+        raw = input_data.as_str()
+        if ijson is not None and orjson is None and len(raw) > _STREAM_MIN_SIZE:
+            content = input_data.content
+            if not isinstance(content, bytes):
+                # surrogatepass keeps lone surrogates encodable; the stream
+                # parser then rejects them and the full parse takes over.
+                content = raw.encode("utf-8", "surrogatepass")
+            streamed = _stream_reindent(content)
+            if streamed is not None:
+                return streamed
         try:
-            parsed = json.loads(raw)
-            return json.dumps(parsed, ensure_ascii=False, indent=2)
-        except (json.JSONDecodeError, TypeError):
+            return _reindent_json(raw)
+        except _JSON_ERRORS:
             return raw
 
     def from_text(self, text: str) -> ModalOutput:
         """Wrap plain text as a JSON object."""
         try:
-            parsed: Any = json.loads(text)
-        except (json.JSONDecodeError, ValueError):
-            parsed = {"text": text}
+            serialized = _reindent_json(text)
+        except _JSON_ERRORS:
+            serialized = _json_dumps({"text": text})
         return ModalOutput(
             modality=Modality.structured,
-            content=json.dumps(parsed, ensure_ascii=False, indent=2),
+            content=serialized,
             mime_type="application/json",
         )
 
@@ -140,11 +366,21 @@ class StructuredHandler(ModalityHandler):
 # Converter
 # ---------------------------------------------------------------------------
 
+_MODALITY_COUNT = len(Modality)
+_PAIR_COUNT = _MODALITY_COUNT * _MODALITY_COUNT
+
 _HANDLER_REGISTRY: dict[Modality, ModalityHandler] = {
     Modality.text: TextHandler(),
     Modality.structured: StructuredHandler(),
 }
 
+# Read-only view of the registry that converters and routers built without
+# custom handlers share instead of copying it; a converter copies it on its
+# first ``register_handler`` call.
+_DEFAULT_HANDLERS: Mapping[Modality, ModalityHandler] = MappingProxyType(
+    _HANDLER_REGISTRY
+)
+
 
 class ModalityConverter:
     """
@@ -161,23 +397,58 @@ class ModalityConverter:
         self,
         handlers: dict[Modality, ModalityHandler] | None = None,
     ) -> None:
-        self._handlers: dict[Modality, ModalityHandler] = (
-            dict(handlers) if handlers else dict(_HANDLER_REGISTRY)
+        self._handlers: Mapping[Modality, ModalityHandler] = (
+            dict(handlers) if handlers else _DEFAULT_HANDLERS
         )
+        # Compiled conversion functions, indexed by
+        # ``source._ord * len(Modality) + target._ord``; pooled variants
+        # follow at an offset of ``_PAIR_COUNT``.
+        self._compiled: list[Callable[[ModalInput], ConversionResult] | None] = [
+            None
+        ] * (2 * _PAIR_COUNT)
 
     def register_handler(self, handler: ModalityHandler) -> None:
-        """Add or replace a modality handler."""
-        self._handlers[handler.modality] = handler
+        """
+        Add or replace a modality handler.
 
-    def convert(
-        self, input_data: ModalInput, target: Modality
-    ) -> ConversionResult:
+        Raises ``TypeError`` on the shared instance returned by
+        :func:`default_converter`, whose handlers are read-only.
         """
-        Convert *input_data* to *target* modality.
+        handlers = self._handlers
+        if handlers is _DEFAULT_HANDLERS:
+            handlers = self._handlers = dict(handlers)
+        elif not isinstance(handlers, dict):
+            raise TypeError(
+                "The shared default converter is read-only; "
+                "create a ModalityConverter() to register handlers."
+            )
+        handlers[handler.modality] = handler
+        self._compiled = [None] * (2 * _PAIR_COUNT)
 
-        Raises ``ValueError`` if source or target modality has no handler.
+    def compile(
+        self,
+        source: Modality | str,
+        target: Modality | str,
+        *,
+        pool: bool = False,
+    ) -> Callable[[ModalInput], ConversionResult]:
         """
-        source = input_data.modality
+        Return a conversion function specialized for *source* -> *target*.
+
+        Handler lookup, the same-modality branch and the quality score are
+        resolved once here rather than on every call.  The returned function
+        does not re-check ``input_data.modality``; only pass it inputs of
+        the *source* modality.  With *pool*, results come from
+        :meth:`ConversionResult.acquire`.
+
+        Modalities may be given as their string values.  Raises
+        ``ValueError`` if source or target modality is unknown or has no
+        handler.
+        """
+        if not isinstance(source, Modality):
+            source = Modality(source)
+        if not isinstance(target, Modality):
+            target = Modality(target)
         source_handler = self._handlers.get(source)
         target_handler = self._handlers.get(target)
 
@@ -190,23 +461,98 @@ class ModalityConverter:
                 f"No handler registered for target modality {target.value!r}."
             )
 
-        if source == target:
-            output = source_handler.handle(input_data)
-            quality = 1.0
-        else:
-            # Two-step: source -> text -> target
-            intermediate_text = source_handler.to_text(input_data)
-            output = target_handler.from_text(intermediate_text)
-            # Quality degrades for multi-hop conversions involving binary
-            # modalities; text<->structured is lossless.
-            quality = _quality_score(source, target)
-
-        return ConversionResult(
-            source_modality=source,
-            target_modality=target,
-            output=output,
-            quality_score=quality,
-        )
+        make_result = ConversionResult.acquire if pool else ConversionResult
+
+        if source is target and type(source_handler) is TextHandler:
+            # Identity fast path: inline TextHandler.handle() so text -> text
+            # skips the handler call entirely.
+            def convert_text(input_data: ModalInput) -> ConversionResult:
+                output = ModalOutput(Modality.text, input_data.as_str(), "text/plain")
+                return make_result(source, target, output, 1.0)
+
+            return convert_text
+
+        if source is target:
+            handle = source_handler.handle
+
+            def convert_same(input_data: ModalInput) -> ConversionResult:
+                return make_result(source, target, handle(input_data), 1.0)
+
+            return convert_same
+
+        # Two-step: source -> text -> target.  Quality degrades for
+        # multi-hop conversions involving binary modalities;
+        # text<->structured is lossless.
+        to_text = source_handler.to_text
+        from_text = target_handler.from_text
+        quality = _quality_score(source, target)
+
+        def convert_pair(input_data: ModalInput) -> ConversionResult:
+            return make_result(source, target, from_text(to_text(input_data)), quality)
+
+        return convert_pair
+
+    def convert(
+        self, input_data: ModalInput, target: Modality | str, *, pool: bool = False
+    ) -> ConversionResult:
+        """
+        Convert *input_data* to *target* modality.
+
+        The specialized function from :meth:`compile` is cached per
+        (source, target) pair and reused on later calls.
+
+        Text -> text with the built-in ``TextHandler`` takes an identity
+        fast path that builds the output directly, without a handler call.
+
+        With *pool*, the result is drawn from the ``ConversionResult`` free
+        list; call its ``release()`` once done with it so the next pooled
+        conversion can reuse it.
+
+        Modalities may be given as their string values.  Raises
+        ``ValueError`` if source or target modality is unknown or has no
+        handler.
+        """
+        if not isinstance(target, Modality):
+            target = Modality(target)
+        source = input_data.modality
+        index = source._ord * _MODALITY_COUNT + target._ord
+        if pool:
+            index += _PAIR_COUNT
+        fn = self._compiled[index]
+        if fn is None:
+            fn = self._compiled[index] = self.compile(source, target, pool=pool)
+        return fn(input_data)
+
+    def convert_batch(
+        self,
+        inputs: Iterable[ModalInput],
+        target: Modality | str,
+        *,
+        pool: bool = False,
+    ) -> list[ConversionResult]:
+        """
+        Convert every item of *inputs* to *target* modality, in order.
+
+        Equivalent to calling :meth:`convert` per item, with the compiled
+        function table and the target offset hoisted out of the loop.
+
+        Raises ``ValueError`` if the target modality is unknown, or if a
+        source or the target modality has no handler.
+        """
+        compiled = self._compiled
+        if not isinstance(target, Modality):
+            target = Modality(target)
+        offset = target._ord + (_PAIR_COUNT if pool else 0)
+        results: list[ConversionResult] = []
+        append = results.append
+        for input_data in inputs:
+            source = input_data.modality
+            index = source._ord * _MODALITY_COUNT + offset
+            fn = compiled[index]
+            if fn is None:
+                fn = compiled[index] = self.compile(source, target, pool=pool)
+            append(fn(input_data))
+        return results
 
     def supported_modalities(self) -> list[Modality]:
         """Return all modalities with registered handlers."""
@@ -218,6 +564,30 @@ class ModalityConverter:
 # ---------------------------------------------------------------------------
 
 
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_WHITESPACE_BYTES = _JSON_WHITESPACE.encode("ascii")
+
+
+def _detect(raw_content: bytes | str) -> Modality:
+    """Uncached implementation of :meth:`ModalityRouter.detect`."""
+    # Cheap first-character prefilter before running the validator.  Only
+    # JSON whitespace is stripped, so str and its UTF-8 bytes classify alike.
+    if isinstance(raw_content, bytes):
+        # Classify and validate the raw bytes: JSON whitespace is ASCII-only,
+        # and the validators check UTF-8 themselves, so nothing is decoded.
+        stripped_bytes = raw_content.strip(_JSON_WHITESPACE_BYTES)
+        if stripped_bytes.startswith((b"{", b"[")) and _is_valid_json(stripped_bytes):
+            return Modality.structured
+        return Modality.text
+    stripped = raw_content.strip(_JSON_WHITESPACE)
+    if stripped.startswith(("{", "[")) and _is_valid_json(stripped):
+        return Modality.structured
+    return Modality.text
+
+
+_detect_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_detect)
+
+
 class ModalityRouter:
     """
     Routes a ModalInput to the appropriate handler.
@@ -229,13 +599,36 @@ class ModalityRouter:
         self,
         handlers: dict[Modality, ModalityHandler] | None = None,
     ) -> None:
-        self._handlers: dict[Modality, ModalityHandler] = (
-            dict(handlers) if handlers else dict(_HANDLER_REGISTRY)
+        self._handlers: Mapping[Modality, ModalityHandler] = (
+            dict(handlers) if handlers else _DEFAULT_HANDLERS
+        )
+        # route() reads handlers from a tuple indexed by ``Modality._ord``
+        # instead of hashing; register_handler() rebuilds it.
+        self._route_table: tuple[ModalityHandler | None, ...] = tuple(
+            self._handlers.get(modality) for modality in Modality
         )
 
+    def register_handler(self, handler: ModalityHandler) -> None:
+        """
+        Add or replace a modality handler.
+
+        Raises ``TypeError`` on the shared instance returned by
+        :func:`default_router`, whose handlers are read-only.
+        """
+        handlers = self._handlers
+        if handlers is _DEFAULT_HANDLERS:
+            handlers = self._handlers = dict(handlers)
+        elif not isinstance(handlers, dict):
+            raise TypeError(
+                "The shared default router is read-only; "
+                "create a ModalityRouter() to register handlers."
+            )
+        handlers[handler.modality] = handler
+        self._route_table = tuple(handlers.get(modality) for modality in Modality)
+
     def route(self, input_data: ModalInput) -> ModalOutput:
         """Dispatch *input_data* to its modality handler."""
-        handler = self._handlers.get(input_data.modality)
+        handler = self._route_table[input_data.modality._ord]
         if handler is None:
             raise ValueError(
                 f"No handler registered for modality {input_data.modality.value!r}."
@@ -249,34 +642,94 @@ class ModalityRouter:
         Rules (in order):
         1. If it is valid JSON -> structured
         2. Otherwise -> text
+
+        Results for payloads up to a few KiB are memoized process-wide.
+        Other bytes-like objects, such as ``bytearray`` or ``memoryview``,
+        are copied to ``bytes`` first; anything else raises ``TypeError``.
         """
-        text = (
-            raw_content.decode("utf-8", errors="replace")
-            if isinstance(raw_content, bytes)
-            else raw_content
-        )
-        stripped = text.strip()
-        if stripped and stripped[0] in ("{", "["):
-            try:
-                json.loads(stripped)
-                return Modality.structured
-            except (json.JSONDecodeError, ValueError):
-                pass
-        return Modality.text
+        if not isinstance(raw_content, (bytes, str)):
+            # The cache needs a hashable key, and _detect() expects bytes.
+            # memoryview() only accepts buffer objects, unlike bytes(),
+            # which would turn an int into that many zero bytes.
+            raw_content = memoryview(raw_content).tobytes()
+        if len(raw_content) <= _CACHE_MAX_PAYLOAD:
+            return _detect_cached(raw_content)
+        return _detect(raw_content)
+
+    def detect_many(self, raw_contents: Iterable[bytes | str]) -> list[Modality]:
+        """
+        Detect the modality of each payload in *raw_contents*.
+
+        Equivalent to calling :meth:`detect` per item, with the method
+        lookup hoisted out of the loop for bulk ingest.
+        """
+        detect = self.detect
+        return [detect(raw) for raw in raw_contents]
+
+
+def clear_caches() -> None:
+    """
+    Empty the process-wide detection and normalization caches.
+
+    Useful for test isolation and for long-running processes whose payload
+    mix has changed; results are unaffected either way.
+    """
+    _detect_cached.cache_clear()
+    _normalize_json_cached.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Shared instances
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def default_converter() -> ModalityConverter:
+    """
+    Return a shared converter over the default handlers.
+
+    The instance is created once and its handler mapping is read-only;
+    construct a ``ModalityConverter`` to register custom handlers.
+    """
+    converter = ModalityConverter()
+    converter._handlers = MappingProxyType(dict(converter._handlers))
+    return converter
+
+
+@functools.lru_cache(maxsize=1)
+def default_router() -> ModalityRouter:
+    """
+    Return a shared router over the default handlers.
+
+    The instance is created once and its handler mapping is read-only.
+    """
+    router = ModalityRouter()
+    router._handlers = MappingProxyType(dict(router._handlers))
+    return router
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Scores for cross-modality pairs; same-modality conversions are always 1.0.
 _QUALITY_MAP: dict[tuple[Modality, Modality], float] = {
     (Modality.text, Modality.structured): 0.95,
     (Modality.structured, Modality.text): 0.95,
-    (Modality.text, Modality.text): 1.0,
-    (Modality.structured, Modality.structured): 1.0,
 }
 
 
+# Dense [source][target] lookup built from _QUALITY_MAP, indexed by
+# ``Modality._ord`` so scoring a pair needs no key tuple or hashing.
+_QUALITY_TABLE: tuple[tuple[float, ...], ...] = tuple(
+    tuple(
+        1.0 if source is target else _QUALITY_MAP.get((source, target), 0.5)
+        for target in Modality
+    )
+    for source in Modality
+)
+
+
 def _quality_score(source: Modality, target: Modality) -> float:
     """Return an estimated quality score for a conversion pair."""
-    return _QUALITY_MAP.get((source, target), 0.5)
+    return _QUALITY_TABLE[source._ord][target._ord]
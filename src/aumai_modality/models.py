@@ -1,11 +1,10 @@
-"""Pydantic models for aumai-modality."""
+"""Data models for aumai-modality."""
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar
 
 __all__ = [
     "Modality",
@@ -24,17 +23,78 @@ class Modality(str, Enum):
     video = "video"
     structured = "structured"
 
+    # Dense position of the member in definition order, assigned below; used
+    # to index lookup tables without hashing the member.
+    _ord: int
+
+
+for _index, _member in enumerate(Modality):
+    _member._ord = _index
+del _index, _member
+
+
+def _ensure_str(content: bytes | str) -> str:
+    """Return *content* as str, decoding bytes as strict UTF-8."""
+    if isinstance(content, str):
+        return content
+    return content.decode("utf-8")
+
 
-class ModalInput(BaseModel):
+@dataclass(slots=True)
+class ModalInput:
     """An input payload in a specific modality."""
 
     modality: Modality
     content: bytes | str
     mime_type: str = "text/plain"
-    metadata: dict[str, Any] = Field(default_factory=dict)
-
-
-class ModalOutput(BaseModel):
+    metadata: dict[str, Any] = field(default_factory=dict)
+    _as_str: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Accept the string value too, as the str-based enum compares equal.
+        if type(self.modality) is not Modality:
+            self.modality = Modality(self.modality)
+
+    def as_str(self) -> str:
+        """
+        Return ``content`` as text, decoding bytes as UTF-8 on first use.
+
+        The decoded string is cached on the instance, so multi-step
+        conversions decode the payload once.  Do not reassign ``content``
+        after calling this.
+        """
+        if self._as_str is None:
+            self._as_str = _ensure_str(self.content)
+        return self._as_str
+
+    @classmethod
+    def validate(
+        cls,
+        modality: Modality | str,
+        content: object,
+        mime_type: object = "text/plain",
+        metadata: object = None,
+    ) -> ModalInput:
+        """
+        Build a ModalInput from untrusted values.
+
+        Coerces ``modality`` from its string value and checks field types.
+        Raises ``ValueError`` for an unknown modality and ``TypeError`` for
+        wrongly typed fields.  Internal code uses the plain constructor.
+        """
+        if not isinstance(content, (bytes, str)):
+            raise TypeError("content must be bytes or str.")
+        if not isinstance(mime_type, str):
+            raise TypeError("mime_type must be a str.")
+        if metadata is None:
+            metadata = {}
+        elif not isinstance(metadata, dict):
+            raise TypeError("metadata must be a dict.")
+        return cls(Modality(modality), content, mime_type, metadata)
+
+
+@dataclass(slots=True)
+class ModalOutput:
     """An output payload in a specific modality."""
 
     modality: Modality
@@ -42,10 +102,66 @@ class ModalOutput(BaseModel):
     mime_type: str = "text/plain"
 
 
-class ConversionResult(BaseModel):
-    """Result of a modality conversion operation."""
+# Placeholder output for pooled results, so a released result does not keep
+# its payload alive.
+_RELEASED_OUTPUT = ModalOutput(Modality.text, "")
+
+
+@dataclass(slots=True)
+class ConversionResult:
+    """
+    Result of a modality conversion operation.
+
+    High-throughput callers can recycle instances through a free list:
+    :meth:`acquire` reuses a released instance when one is available and
+    :meth:`release` hands an instance back.  A released result must not be
+    used again; when the pool is empty, ``acquire`` simply allocates.
+    """
 
     source_modality: Modality
     target_modality: Modality
     output: ModalOutput
-    quality_score: float = Field(default=1.0, ge=0.0, le=1.0)
+    quality_score: float = 1.0
+
+    _pool: ClassVar[list[ConversionResult]] = []
+    _POOL_MAX: ClassVar[int] = 256
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.quality_score <= 1.0:
+            raise ValueError(
+                f"quality_score must be between 0.0 and 1.0, got {self.quality_score}."
+            )
+
+    @classmethod
+    def acquire(
+        cls,
+        source_modality: Modality,
+        target_modality: Modality,
+        output: ModalOutput,
+        quality_score: float = 1.0,
+    ) -> ConversionResult:
+        """Return a result with these fields, reusing a released instance."""
+        try:
+            result = cls._pool.pop()
+        except IndexError:
+            return cls(source_modality, target_modality, output, quality_score)
+        result.source_modality = source_modality
+        result.target_modality = target_modality
+        result.output = output
+        result.quality_score = quality_score
+        result.__post_init__()
+        return result
+
+    def release(self) -> None:
+        """
+        Return this instance to the pool; do not use it afterwards.
+
+        Releasing an already released instance is a no-op, so one object is
+        never handed out to two callers.
+        """
+        if self.output is _RELEASED_OUTPUT:
+            return
+        self.output = _RELEASED_OUTPUT
+        pool = ConversionResult._pool
+        if len(pool) < ConversionResult._POOL_MAX:
+            pool.append(self)
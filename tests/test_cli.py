@@ -8,12 +8,13 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
-from aumai_modality.cli import main, _guess_mime
+from aumai_modality.cli import main, _guess_mime, _write_output
 from aumai_modality.models import Modality
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
+    # CliRunner keeps no state between invoke() calls, so one is shared.
     return CliRunner()
 
 
@@ -54,14 +55,35 @@ def test_cli_version(runner: CliRunner) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_detect_text_file(runner: CliRunner, text_file: Path) -> None:
-    result = runner.invoke(main, ["detect", "--input", str(text_file)])
+@pytest.mark.parametrize(
+    "fixture_name, expected",
+    [
+        ("text_file", "Detected modality: text"),
+        ("json_file", "Detected modality: structured"),
+        ("invalid_json_file", "Detected modality: text"),
+    ],
+)
+def test_detect(
+    runner: CliRunner,
+    request: pytest.FixtureRequest,
+    fixture_name: str,
+    expected: str,
+) -> None:
+    path: Path = request.getfixturevalue(fixture_name)
+    result = runner.invoke(
+        main, ["detect", "--input", str(path)], standalone_mode=False
+    )
     assert result.exit_code == 0
-    assert "text" in result.output
+    assert expected in result.output
 
 
-def test_detect_json_file(runner: CliRunner, json_file: Path) -> None:
-    result = runner.invoke(main, ["detect", "--input", str(json_file)])
+def test_detect_reads_through_read_input(
+    runner: CliRunner, text_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "aumai_modality.cli._read_input", lambda path: b'{"injected": true}'
+    )
+    result = runner.invoke(main, ["detect", "--input", str(text_file)])
     assert result.exit_code == 0
     assert "structured" in result.output
 
@@ -152,6 +174,13 @@ def test_convert_writes_output_file(
     assert "Converted output written to" in result.output
 
 
+def test_write_output_truncates_and_keeps_bytes(tmp_path: Path) -> None:
+    out = tmp_path / "out.bin"
+    out.write_bytes(b"previous, longer content")
+    _write_output(str(out), b"\xff\x00line\n")
+    assert out.read_bytes() == b"\xff\x00line\n"
+
+
 def test_convert_unknown_source_modality_exits_nonzero(
     runner: CliRunner, text_file: Path
 ) -> None:
@@ -197,6 +226,9 @@ def test_convert_requires_target(runner: CliRunner, text_file: Path) -> None:
         ("file.wav", Modality.voice, "audio/wav"),
         ("file.mp4", Modality.video, "video/mp4"),
         ("file.bin", Modality.image, "application/octet-stream"),
+        ("dir.d/archive.tar.JSON", Modality.structured, "application/json"),
+        ("broken.json", Modality.text, "application/json"),
+        ("README", Modality.text, "application/octet-stream"),
     ],
 )
 def test_guess_mime(
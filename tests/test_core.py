@@ -8,9 +8,20 @@ import pytest
 
 from aumai_modality.core import (
     ModalityConverter,
+    ModalityHandler,
     ModalityRouter,
     StructuredHandler,
     TextHandler,
+    _CACHE_MAX_PAYLOAD,
+    _LONG_DIGIT_RUN,
+    _STDLIB_ENCODER,
+    _detect,
+    _detect_cached,
+    _normalize_json_cached,
+    clear_caches,
+    default_converter,
+    default_router,
+    _is_valid_json,
     _quality_score,
 )
 from aumai_modality.models import ConversionResult, ModalInput, ModalOutput, Modality
@@ -25,6 +36,9 @@ class TestTextHandler:
     def test_modality_property(self, text_handler: TextHandler) -> None:
         assert text_handler.modality == Modality.text
 
+    def test_satisfies_handler_protocol(self, text_handler: TextHandler) -> None:
+        assert isinstance(text_handler, ModalityHandler)
+
     def test_handle_string_content(
         self, text_handler: TextHandler, text_input: ModalInput
     ) -> None:
@@ -113,6 +127,27 @@ class TestStructuredHandler:
         assert "text" in parsed
         assert "not valid json" in parsed["text"]
 
+    def test_handle_reserializes_indented_looking_json(
+        self, structured_handler: StructuredHandler
+    ) -> None:
+        raw = '{\n  "a":1,"b":{"c":[1,2]},"a":"\\u00e9"\n}'
+        normalized = {"a": "é", "b": {"c": [1, 2]}}
+        expected = json.dumps(normalized, indent=2, ensure_ascii=False)
+        payload = ModalInput(Modality.structured, raw)
+        assert structured_handler.handle(payload).content == expected
+
+    def test_handle_caches_normalized_output(
+        self, structured_handler: StructuredHandler
+    ) -> None:
+        payload = ModalInput(
+            modality=Modality.structured, content='{"probe":"handle-cache-test"}'
+        )
+        first = structured_handler.handle(payload)
+        hits = _normalize_json_cached.cache_info().hits
+        second = structured_handler.handle(payload)
+        assert second == first
+        assert _normalize_json_cached.cache_info().hits == hits + 1
+
     def test_to_text_returns_formatted_json(
         self,
         structured_handler: StructuredHandler,
@@ -122,6 +157,15 @@ class TestStructuredHandler:
         parsed = json.loads(text)
         assert parsed["name"] == "Alice"
 
+    def test_to_text_matches_stdlib_indent(
+        self,
+        structured_handler: StructuredHandler,
+        structured_input: ModalInput,
+    ) -> None:
+        text = structured_handler.to_text(structured_input)
+        expected = json.dumps(json.loads(str(structured_input.content)), indent=2)
+        assert text == expected
+
     def test_to_text_invalid_json_returns_raw(
         self, structured_handler: StructuredHandler
     ) -> None:
@@ -140,6 +184,15 @@ class TestStructuredHandler:
         assert parsed["x"] == 1
         assert output.mime_type == "application/json"
 
+    def test_from_text_keeps_non_ascii_unescaped(
+        self, structured_handler: StructuredHandler
+    ) -> None:
+        output = structured_handler.from_text('{"city": "Zürich", "emoji": "🚀"}')
+        assert isinstance(output.content, str)
+        assert "Zürich" in output.content
+        assert "🚀" in output.content
+        assert "\\u" not in output.content
+
     def test_from_text_plain_text_wraps(
         self, structured_handler: StructuredHandler
     ) -> None:
@@ -177,6 +230,16 @@ class TestModalityConverter:
         assert result.target_modality == Modality.text
         assert result.quality_score == 1.0
 
+    def test_same_modality_conversion_text_bytes(
+        self, converter: ModalityConverter, text_bytes_input: ModalInput
+    ) -> None:
+        result = converter.convert(text_bytes_input, Modality.text)
+        assert result.output == ModalOutput(
+            modality=Modality.text,
+            content="Binary encoded text content.",
+            mime_type="text/plain",
+        )
+
     def test_same_modality_conversion_structured(
         self,
         converter: ModalityConverter,
@@ -185,6 +248,23 @@ class TestModalityConverter:
         result = converter.convert(structured_input, Modality.structured)
         assert result.quality_score == 1.0
 
+    def test_same_modality_conversion_skips_text_round_trip(
+        self,
+        converter: ModalityConverter,
+        structured_input: ModalInput,
+    ) -> None:
+        class HandleOnlyStructuredHandler(StructuredHandler):
+            def to_text(self, input_data: ModalInput) -> str:
+                raise AssertionError("same-modality must not call to_text")
+
+            def from_text(self, text: str) -> ModalOutput:
+                raise AssertionError("same-modality must not call from_text")
+
+        converter.register_handler(HandleOnlyStructuredHandler())
+        result = converter.convert(structured_input, Modality.structured)
+        assert result.quality_score == 1.0
+        assert json.loads(str(result.output.content))["name"] == "Alice"
+
     def test_text_to_structured_conversion(
         self, converter: ModalityConverter, text_input: ModalInput
     ) -> None:
@@ -236,6 +316,106 @@ class TestModalityConverter:
         converter.register_handler(new_handler)
         assert converter._handlers[Modality.text] is new_handler
 
+    def test_register_handler_leaves_other_converters_alone(self) -> None:
+        first, second = ModalityConverter(), ModalityConverter()
+        assert first._handlers is second._handlers
+        new_handler = TextHandler()
+        first.register_handler(new_handler)
+        assert first._handlers[Modality.text] is new_handler
+        assert second._handlers[Modality.text] is not new_handler
+        assert ModalityConverter()._handlers[Modality.text] is not new_handler
+
+    def test_register_duck_typed_handler(
+        self, converter: ModalityConverter
+    ) -> None:
+        class EchoVoiceHandler:
+            modality = Modality.voice
+
+            def handle(self, input_data: ModalInput) -> ModalOutput:
+                return ModalOutput(Modality.voice, input_data.content)
+
+            def to_text(self, input_data: ModalInput) -> str:
+                return "transcript"
+
+            def from_text(self, text: str) -> ModalOutput:
+                return ModalOutput(Modality.voice, text.encode(), "audio/wav")
+
+        handler = EchoVoiceHandler()
+        assert isinstance(handler, ModalityHandler)
+        converter.register_handler(handler)
+        voice_input = ModalInput(modality=Modality.voice, content=b"\x00")
+        result = converter.convert(voice_input, Modality.text)
+        assert result.output.content == "transcript"
+
+    def test_compile_matches_convert(
+        self, converter: ModalityConverter, text_input: ModalInput
+    ) -> None:
+        compiled = converter.compile(Modality.text, Modality.structured)
+        assert compiled(text_input) == converter.convert(
+            text_input, Modality.structured
+        )
+
+    def test_compile_missing_handler_raises(
+        self, converter: ModalityConverter
+    ) -> None:
+        with pytest.raises(ValueError, match="No handler registered for target"):
+            converter.compile(Modality.text, Modality.image)
+
+    def test_convert_pooled_matches_convert(
+        self, converter: ModalityConverter, text_input: ModalInput
+    ) -> None:
+        pooled = converter.convert(text_input, Modality.structured, pool=True)
+        assert pooled == converter.convert(text_input, Modality.structured)
+        pooled.release()
+
+    def test_convert_batch_matches_convert(
+        self,
+        converter: ModalityConverter,
+        text_input: ModalInput,
+        structured_input: ModalInput,
+        text_bytes_input: ModalInput,
+    ) -> None:
+        inputs = [text_input, structured_input, text_bytes_input]
+        results = converter.convert_batch(inputs, Modality.structured)
+        assert results == [converter.convert(i, Modality.structured) for i in inputs]
+
+    def test_convert_batch_missing_handler_raises(
+        self, converter: ModalityConverter, text_input: ModalInput
+    ) -> None:
+        with pytest.raises(ValueError, match="No handler registered for target"):
+            converter.convert_batch([text_input], Modality.video)
+
+    def test_string_modalities_are_accepted(
+        self, converter: ModalityConverter, text_input: ModalInput
+    ) -> None:
+        expected = converter.convert(text_input, Modality.structured)
+        assert converter.convert(text_input, "structured") == expected
+        assert converter.convert_batch([text_input], "structured") == [expected]
+        assert converter.compile("text", "structured")(text_input) == expected
+        string_input = ModalInput(modality="text", content=text_input.content)
+        assert converter.convert(string_input, Modality.structured) == expected
+
+    @pytest.mark.parametrize("method", ["convert", "convert_batch"])
+    def test_unknown_string_target_raises_value_error(
+        self, converter: ModalityConverter, text_input: ModalInput, method: str
+    ) -> None:
+        arg = text_input if method == "convert" else [text_input]
+        with pytest.raises(ValueError, match="not a valid Modality"):
+            getattr(converter, method)(arg, "hologram")
+
+    def test_register_handler_invalidates_compiled(
+        self, converter: ModalityConverter, text_input: ModalInput
+    ) -> None:
+        converter.convert(text_input, Modality.text)
+
+        class ShoutingHandler(TextHandler):
+            def handle(self, input_data: ModalInput) -> ModalOutput:
+                return self.from_text(input_data.as_str().upper())
+
+        converter.register_handler(ShoutingHandler())
+        result = converter.convert(text_input, Modality.text)
+        assert result.output.content == str(text_input.content).upper()
+
 
 # ---------------------------------------------------------------------------
 # ModalityRouter tests
@@ -263,6 +443,28 @@ class TestModalityRouter:
         with pytest.raises(ValueError, match="No handler registered"):
             router.route(voice_input)
 
+    def test_route_uses_custom_handlers(self, text_input: ModalInput) -> None:
+        router = ModalityRouter({Modality.structured: StructuredHandler()})
+        with pytest.raises(ValueError, match="No handler registered"):
+            router.route(text_input)
+        structured = ModalInput(modality=Modality.structured, content="[1]")
+        assert router.route(structured).modality == Modality.structured
+
+    @pytest.mark.parametrize("custom", [False, True])
+    def test_register_handler_routes_new_modality(self, custom: bool) -> None:
+        class EchoVoiceHandler(TextHandler):
+            @property
+            def modality(self) -> Modality:
+                return Modality.voice
+
+        router = ModalityRouter({Modality.text: TextHandler()} if custom else None)
+        voice = ModalInput(modality=Modality.voice, content="hi")
+        with pytest.raises(ValueError, match="No handler registered"):
+            router.route(voice)
+        router.register_handler(EchoVoiceHandler())
+        assert router.route(voice).content == "hi"
+        assert Modality.voice not in ModalityRouter()._handlers
+
     def test_detect_json_object(self, router: ModalityRouter) -> None:
         raw = '{"key": "value"}'
         assert router.detect(raw) == Modality.structured
@@ -287,12 +489,410 @@ class TestModalityRouter:
         raw = b"Hello world"
         assert router.detect(raw) == Modality.text
 
+    def test_detect_bytes_json_with_whitespace(self, router: ModalityRouter) -> None:
+        raw = b'\n\t  {"x": [1, 2]}\r\n'
+        assert router.detect(raw) == Modality.structured
+
+    def test_detect_binary_bytes(self, router: ModalityRouter) -> None:
+        raw = b"\x89PNG\r\n\x1a\n\x00\xff"
+        assert router.detect(raw) == Modality.text
+
+    def test_detect_invalid_utf8_json_like(self, router: ModalityRouter) -> None:
+        raw = b'{"x": "\xff\xfe"}'
+        assert router.detect(raw) == Modality.text
+
+    def test_detect_empty_bytes(self, router: ModalityRouter) -> None:
+        assert router.detect(b"") == Modality.text
+
     def test_detect_empty_string(self, router: ModalityRouter) -> None:
         assert router.detect("") == Modality.text
 
     def test_detect_whitespace_only(self, router: ModalityRouter) -> None:
         assert router.detect("   ") == Modality.text
 
+    @pytest.mark.parametrize(
+        "raw", ["plain text", "  leading space", "", "   ", b"bytes text", b""]
+    )
+    def test_detect_plain_text_skips_validator(
+        self, raw: bytes | str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(text: str) -> bool:
+            raise AssertionError("validator must not run for non-JSON prefixes")
+
+        monkeypatch.setattr("aumai_modality.core._is_valid_json", fail)
+        assert _detect(raw) == Modality.text
+
+    def test_detect_caches_small_payloads(self, router: ModalityRouter) -> None:
+        raw = b'{"heartbeat": "detect-cache-test"}'
+        router.detect(raw)
+        hits = _detect_cached.cache_info().hits
+        assert router.detect(raw) == Modality.structured
+        assert _detect_cached.cache_info().hits == hits + 1
+
+    def test_clear_caches_empties_detect_and_normalize(
+        self, router: ModalityRouter
+    ) -> None:
+        router.detect('{"probe": "clear-caches-test"}')
+        StructuredHandler().handle(ModalInput(Modality.structured, "clear-caches"))
+        clear_caches()
+        assert _detect_cached.cache_info().currsize == 0
+        assert _normalize_json_cached.cache_info().currsize == 0
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (b'{"a": 1}', Modality.structured),
+            (b"plain text", Modality.text),
+            (b'{"blob": "' + b"x" * _CACHE_MAX_PAYLOAD + b'"}', Modality.structured),
+        ],
+    )
+    def test_detect_accepts_bytes_like(
+        self, router: ModalityRouter, wrap: type, raw: bytes, expected: Modality
+    ) -> None:
+        assert router.detect(wrap(raw)) == expected
+
+    @pytest.mark.parametrize("raw", [10**9, [123, 125], None])
+    def test_detect_rejects_non_buffer_input(
+        self, router: ModalityRouter, raw: object
+    ) -> None:
+        with pytest.raises(TypeError):
+            router.detect(raw)
+
+    def test_detect_skips_cache_for_large_payloads(
+        self, router: ModalityRouter
+    ) -> None:
+        raw = '{"blob": "' + "x" * _CACHE_MAX_PAYLOAD + '"}'
+        misses = _detect_cached.cache_info().misses
+        assert router.detect(raw) == Modality.structured
+        assert _detect_cached.cache_info().misses == misses
+
+    def test_detect_many_matches_detect(self, router: ModalityRouter) -> None:
+        raws: list[bytes | str] = [
+            '{"a": 1}',
+            b"[1, 2]",
+            "plain text",
+            b"{not valid json",
+            "",
+        ]
+        assert router.detect_many(raws) == [router.detect(r) for r in raws]
+
+    def test_detect_many_empty(self, router: ModalityRouter) -> None:
+        assert router.detect_many([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Shared instance tests
+# ---------------------------------------------------------------------------
+
+
+class TestDefaultInstances:
+    def test_default_converter_is_shared(self) -> None:
+        assert default_converter() is default_converter()
+
+    def test_default_router_is_shared(self) -> None:
+        assert default_router() is default_router()
+
+    def test_default_converter_rejects_registration(self) -> None:
+        with pytest.raises(TypeError, match="read-only"):
+            default_converter().register_handler(TextHandler())
+
+    def test_default_router_rejects_registration(self) -> None:
+        with pytest.raises(TypeError, match="read-only"):
+            default_router().register_handler(TextHandler())
+
+    def test_default_converter_converts(self, text_input: ModalInput) -> None:
+        result = default_converter().convert(text_input, Modality.structured)
+        assert result.quality_score == pytest.approx(0.95)
+
+
+# ---------------------------------------------------------------------------
+# _is_valid_json tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": [1, 2, {"b": null}]}', True),
+        ("[]", True),
+        ('"just a string"', True),
+        ("{not valid json", False),
+        ('{"a": 1} trailing', False),
+        ("", False),
+    ],
+)
+def test_is_valid_json(text: str, expected: bool) -> None:
+    assert _is_valid_json(text) is expected
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b'{"a": [1, 2]}', True),
+        ('{"city": "Zürich"}'.encode(), True),
+        (b'{"a": "\xff"}', False),
+        (b"{not valid json", False),
+    ],
+)
+def test_is_valid_json_bytes(data: bytes, expected: bool) -> None:
+    assert _is_valid_json(data) is expected
+
+
+def test_is_valid_json_reuses_simdjson_parser() -> None:
+    pytest.importorskip("simdjson")
+    from aumai_modality.core import _simdjson_parser
+
+    assert _is_valid_json("[1]") is True
+    assert _is_valid_json("{bad") is False
+    assert _is_valid_json('{"a": 2}') is True
+    assert _simdjson_parser() is _simdjson_parser()
+
+
+def test_is_valid_json_without_simdjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("aumai_modality.core.simdjson", None)
+    assert _is_valid_json('{"a": 1}') is True
+    assert _is_valid_json("{not valid json") is False
+
+
+def test_is_valid_json_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("aumai_modality.core.simdjson", None)
+    monkeypatch.setattr("aumai_modality.core.orjson", None)
+    assert _is_valid_json(' {"a": [1, 2]}\n') is True
+    assert _is_valid_json('{"a": 1} trailing') is False
+    assert _is_valid_json("") is False
+
+
+def test_orjson_and_stdlib_dumps_agree() -> None:
+    pytest.importorskip("orjson")
+    from aumai_modality.core import _orjson_dumps
+
+    obj = {"name": "Zoë", "nested": {"items": [1, 2.5, None, True]}, "empty": {}}
+    assert _orjson_dumps(obj) == _STDLIB_ENCODER.encode(obj)
+
+
+@pytest.mark.parametrize(
+    "value, orjson_text, stdlib_text",
+    [
+        (0.00001, "0.00001", "1e-05"),
+        (1e20, "1e20", "1e+20"),
+    ],
+)
+def test_orjson_and_stdlib_spell_floats_differently(
+    value: float, orjson_text: str, stdlib_text: str
+) -> None:
+    # Known, documented difference: the parsed value is the same.
+    pytest.importorskip("orjson")
+    from aumai_modality.core import _orjson_dumps
+
+    assert _orjson_dumps(value) == orjson_text
+    assert _STDLIB_ENCODER.encode(value) == stdlib_text
+    assert json.loads(orjson_text) == json.loads(stdlib_text) == value
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["[NaN, Infinity]", '{"n": 18446744073709551616}', '["\\ud800"]'],
+)
+@pytest.mark.parametrize("backend", ["simdjson", "orjson", "stdlib"])
+def test_backends_agree_on_validity(
+    raw: str, backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if backend != "simdjson":
+        monkeypatch.setattr("aumai_modality.core.simdjson", None)
+    if backend == "stdlib":
+        monkeypatch.setattr("aumai_modality.core.orjson", None)
+    assert _is_valid_json(raw) is True
+    assert _is_valid_json(raw.encode("utf-8")) is True
+
+
+_BIG_INT_DOC = '{"n": 18446744073709551616}'
+_SURROGATE_DOC = '"\ud800"'
+
+
+@pytest.mark.parametrize(
+    "number",
+    ["18446744073709551616", "-9223372036854775809", "-9999999999999999999"],
+)
+def test_big_integers_survive_round_trips(number: str) -> None:
+    handler = StructuredHandler()
+    doc = '{"n": ' + number + "}"
+    payload = ModalInput(Modality.structured, doc)
+    expected = '{\n  "n": ' + number + "\n}"
+    assert handler.handle(payload).content == expected
+    assert handler.to_text(payload) == expected
+    assert handler.from_text(doc).content == expected
+    converted = ModalityConverter().convert(payload, Modality.text)
+    assert converted.output.content == expected
+
+
+@pytest.mark.parametrize(
+    "raw, matches",
+    [
+        ("[-9223372036854775809]", True),
+        ('{"n": 18446744073709551616}', True),
+        ('["id 1234567890123456789"]', True),
+        ("[0.0075149371705205414]", False),
+        ("[1234567890123456789.5]", False),
+        ("[1234567890123456789e3]", False),
+        ("[922337203685477580]", False),
+    ],
+)
+def test_long_digit_run_matches_only_long_integers(raw: str, matches: bool) -> None:
+    assert (_LONG_DIGIT_RUN.search(raw) is not None) is matches
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        _BIG_INT_DOC,
+        "[123456789012345678901234567890]",
+        "[-9223372036854775809]",
+    ],
+)
+def test_detect_accepts_big_integers(raw: str) -> None:
+    assert _detect(raw) == Modality.structured
+    assert _detect(raw.encode("utf-8")) == Modality.structured
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (" \n{}", Modality.structured),
+        ("\t[1]\r\n", Modality.structured),
+        ("\u00a0{}", Modality.text),
+        ("\x1c{}", Modality.text),
+        ("{}\u2028", Modality.text),
+    ],
+)
+def test_detect_str_and_bytes_agree(raw: str, expected: Modality) -> None:
+    assert _detect(raw) == expected
+    assert _detect(raw.encode("utf-8")) == expected
+
+
+def test_lone_surrogates_are_handled() -> None:
+    handler = StructuredHandler()
+    payload = ModalInput(Modality.structured, _SURROGATE_DOC)
+    assert handler.handle(payload).content == _SURROGATE_DOC
+    assert handler.from_text(_SURROGATE_DOC).content == _SURROGATE_DOC
+    wrapped = handler.from_text("plain \ud800 text").content
+    assert json.loads(str(wrapped)) == {"text": "plain \ud800 text"}
+
+
+# ---------------------------------------------------------------------------
+# Re-indentation tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"a": 1}',
+        json.dumps({"a": 1}, indent=4),
+        json.dumps({"a": [1, 2], "b": {"c": None}}, indent=2),
+        '{\n  "a":1,"b":{"c":[1,2]}\n}',
+        '{\n  "a": 1,\n   "b": 2\n}',
+        '{\n  "a": [1,\n    2]\n}',
+        '{\n  "a": 1 \n}',
+        '{\n\t"a": 1\n}',
+        '{\n  "a": {\n  "b": 1\n  }\n}',
+        '{\n  "a": 1,\n      "b": 2\n}',
+        '{\n  "a": 1,\n  "a": "\\u00e9"\n}',
+        "[]",
+    ],
+)
+def test_to_text_always_reindents(raw: str) -> None:
+    text = StructuredHandler().to_text(ModalInput(Modality.structured, raw))
+    assert text == json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Streaming re-indent tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "{}",
+        "[]",
+        "5",
+        '"plain"',
+        '{"a": {}, "b": [], "c": [{}], "d": [[[]], [1]]}',
+        '{"d": [1, 2.5, -3e-05, true, false, null, "Zoë\\n\\u0001"]}',
+        '{"k": {"x": {"y": [1, {"z": null}]}}}',
+        "[0.00001, 1e20, 1E5, -0, -0.0, 9223372036854775807]",
+    ],
+)
+def test_stream_reindent_matches_stdlib_backend(
+    raw: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("ijson")
+    from aumai_modality import core
+
+    monkeypatch.setattr(core, "orjson", None)
+    assert core._stream_reindent(raw.encode("utf-8")) == core._reindent_json(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"[18446744073709551616]",
+        b"[1e400]",
+        b'["\\ud800"]',
+        b'["\\udc00x"]',
+        b'["\\ud83d\\ude00"]',
+        b"[1, oops]",
+    ],
+)
+def test_stream_reindent_declines_what_it_cannot_reproduce(raw: bytes) -> None:
+    pytest.importorskip("ijson")
+    from aumai_modality.core import _stream_reindent
+
+    assert _stream_reindent(raw) is None
+
+
+def test_to_text_streams_large_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("ijson")
+    from aumai_modality import core
+
+    monkeypatch.setattr(core, "orjson", None)
+    monkeypatch.setattr(core, "_reindent_json", None)
+    doc = {"name": "Alice", "items": [{"id": i, "tags": ["x"]} for i in range(5000)]}
+    raw = json.dumps(doc).encode("utf-8")
+    assert len(raw) > core._STREAM_MIN_SIZE
+    text = StructuredHandler().to_text(ModalInput(Modality.structured, raw))
+    assert text == json.dumps(doc, indent=2)
+    assert json.loads(text)["name"] == "Alice"
+
+
+@pytest.mark.parametrize("stdlib_backend", [False, True])
+@pytest.mark.parametrize("extra", ["", ', "big": 18446744073709551616'])
+def test_to_text_output_does_not_depend_on_size(
+    stdlib_backend: bool, extra: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from aumai_modality import core
+
+    if stdlib_backend:
+        monkeypatch.setattr(core, "orjson", None)
+    small = '{"f": [0.00001, 1e20]' + extra + "}"
+    pad = "x" * core._STREAM_MIN_SIZE
+    large = '{"f": [0.00001, 1e20], "pad": "' + pad + '"' + extra + "}"
+    handler = StructuredHandler()
+    small_text = handler.to_text(ModalInput(Modality.structured, small))
+    large_text = handler.to_text(ModalInput(Modality.structured, large))
+    assert small_text == core._reindent_json(small)
+    assert large_text == core._reindent_json(large)
+    assert small_text.split("\n")[:4] == large_text.split("\n")[:4]
+
+
+def test_to_text_streaming_invalid_json_returns_raw() -> None:
+    pytest.importorskip("ijson")
+    from aumai_modality.core import _STREAM_MIN_SIZE
+
+    raw = "[" + "1, " * _STREAM_MIN_SIZE + "oops]"
+    assert StructuredHandler().to_text(ModalInput(Modality.structured, raw)) == raw
+
 
 # ---------------------------------------------------------------------------
 # _quality_score tests
@@ -306,6 +906,7 @@ class TestModalityRouter:
         (Modality.structured, Modality.text, 0.95),
         (Modality.text, Modality.text, 1.0),
         (Modality.structured, Modality.structured, 1.0),
+        (Modality.voice, Modality.voice, 1.0),
         (Modality.text, Modality.voice, 0.5),
         (Modality.voice, Modality.text, 0.5),
         (Modality.image, Modality.video, 0.5),
@@ -344,6 +945,71 @@ class TestModels:
         inp = ModalInput(modality=Modality.text, content="hello")
         assert inp.mime_type == "text/plain"
 
+    def test_modal_input_coerces_string_modality(self) -> None:
+        inp = ModalInput(modality="structured", content="{}")
+        assert inp.modality is Modality.structured
+        assert ModalityRouter().route(inp).mime_type == "application/json"
+
+    def test_modal_input_rejects_unknown_modality(self) -> None:
+        with pytest.raises(ValueError):
+            ModalInput(modality="hologram", content="x")
+
+    def test_modal_input_as_str_decodes_bytes_once(self) -> None:
+        inp = ModalInput(modality=Modality.text, content="héllo".encode())
+        first = inp.as_str()
+        assert first == "héllo"
+        assert inp.as_str() is first
+
+    def test_modal_input_as_str_returns_str_content(self) -> None:
+        inp = ModalInput(modality=Modality.text, content="hello")
+        assert inp.as_str() is inp.content
+
+    def test_modal_input_as_str_not_in_equality(self) -> None:
+        a = ModalInput(modality=Modality.text, content="hello")
+        b = ModalInput(modality=Modality.text, content="hello")
+        a.as_str()
+        assert a == b
+
+    def test_modal_input_validate_coerces_modality(self) -> None:
+        inp = ModalInput.validate(modality="structured", content=b"{}")
+        assert inp.modality is Modality.structured
+
+    def test_modal_input_validate_rejects_unknown_modality(self) -> None:
+        with pytest.raises(ValueError):
+            ModalInput.validate(modality="smell", content="x")
+
+    def test_modal_input_validate_rejects_bad_content(self) -> None:
+        with pytest.raises(TypeError, match="content"):
+            ModalInput.validate(modality="text", content=42)
+
+    def test_conversion_result_release_and_acquire_reuses(self) -> None:
+        output = ModalOutput(modality=Modality.text, content="x")
+        first = ConversionResult.acquire(Modality.text, Modality.text, output)
+        first.release()
+        assert first.output is not output
+        second = ConversionResult.acquire(
+            Modality.text, Modality.structured, output, 0.95
+        )
+        assert second is first
+        assert second.target_modality is Modality.structured
+        assert second.output is output
+        assert second.quality_score == 0.95
+
+    def test_conversion_result_double_release_is_ignored(self) -> None:
+        output = ModalOutput(modality=Modality.text, content="x")
+        result = ConversionResult.acquire(Modality.text, Modality.text, output)
+        result.release()
+        result.release()
+        first = ConversionResult.acquire(Modality.text, Modality.text, output)
+        second = ConversionResult.acquire(Modality.text, Modality.text, output)
+        assert first is not second
+
+    def test_conversion_result_acquire_validates_quality(self) -> None:
+        output = ModalOutput(modality=Modality.text, content="x")
+        ConversionResult.acquire(Modality.text, Modality.text, output).release()
+        with pytest.raises(ValueError):
+            ConversionResult.acquire(Modality.text, Modality.text, output, 2.0)
+
     def test_conversion_result_quality_bounds(self) -> None:
         output = ModalOutput(modality=Modality.text, content="x")
         with pytest.raises(Exception):